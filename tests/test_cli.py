@@ -58,6 +58,51 @@ def test_resolve_pawprints_env_override(monkeypatch, tmp_path):
     assert resolved == override_path
 
 
+def test_fast_parse_matches_argparse_for_common_shapes():
+    argvs = [
+        [],
+        ["--demo"],
+        ["--demo", "--quiet"],
+        ["--domain", "example.com"],
+        ["--domain=example.com", "--timeout", "2.5"],
+        [
+            "--domain",
+            "example.com",
+            "--modules",
+            "whois,dns",
+            "--output",
+            "report.md",
+            "--json-output",
+            "report.json",
+        ],
+        ["--url", "https://example.com", "--no-log"],
+        ["--ip", "203.0.113.7", "--list-modules"],
+        ["--domain="],
+    ]
+
+    for argv in argvs:
+        fast = cli._fast_parse(argv)
+
+        assert fast is not None, argv
+        assert vars(fast) == vars(cli.build_parser().parse_args(argv))
+
+
+def test_fast_parse_falls_back_on_malformed_argv():
+    malformed = [
+        ["--help"],
+        ["--unknown"],
+        ["--domain"],
+        ["--domain", "--ip"],
+        ["--timeout", "not-a-number"],
+        ["--quiet=1"],
+        ["--quiet="],
+        ["--domain=", "x"],
+    ]
+
+    for argv in malformed:
+        assert cli._fast_parse(argv) is None, argv
+
+
 def test_modules_help_uses_hyphenated_comma_separated():
     parser = cli.build_parser()
 
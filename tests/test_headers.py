@@ -8,7 +8,7 @@ from urllib.request import Request
 
 from williecat.core import ReconContext
 from williecat.demo import load_demo_run
-from williecat.http import HttpSession
+from williecat.http import CaseInsensitiveHeaders, HttpSession
 from williecat.modules.header_sniffer import HeaderSnifferModule
 
 
@@ -84,6 +84,14 @@ def test_header_sniffer_falls_back_to_get_after_head_405():
     assert "HEAD not supported" in result.warnings[0]
 
 
+def test_case_insensitive_headers_store_lowercased_keys():
+    headers = CaseInsensitiveHeaders([("Strict-Transport-Security", "max-age=1"), ("Server", "nginx")])
+
+    assert list(headers) == ["strict-transport-security", "server"]
+    assert headers.get("strict-transport-security") == "max-age=1"
+    assert headers.get("STRICT-TRANSPORT-SECURITY") == "max-age=1"
+
+
 def test_demo_headers_warning_matches_fallback_method():
     _, results = load_demo_run()
     headers_result = next(result for result in results if result.module == "headers")
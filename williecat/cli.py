@@ -1,20 +1,137 @@
 """Command line interface for Williecat."""
 from __future__ import annotations
 
-import argparse
+import functools
 import sys
 from pathlib import Path
-from typing import Iterable
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    import argparse
+
+# Re-exported lazily via __getattr__ so that --help/--list-modules runs do
+# not pay for importing the workflow and every recon module.
+_WORKFLOW_EXPORTS = frozenset(
+    {"PAWPRINTS_ENV_VAR", "RunRequest", "_resolve_pawprints_path", "run_recon"}
+)
+
+
+def __getattr__(name: str):
+    if name in _WORKFLOW_EXPORTS:
+        from .product import workflow
+
+        return getattr(workflow, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-from .modules import get_module_registry
-from .product.workflow import PAWPRINTS_ENV_VAR, RunRequest, _resolve_pawprints_path, run_recon
 
 BANNER = r"""/\_/\  Williecat v0.1
 ( o.o ) Reconnaissance with Instinct
 ^ <"""
 
-
+_DEMO_NOTICE = "[demo] Using built-in sample data – no network requests performed."
+
+# Pre-encoded once so startup output skips the per-call TextIOWrapper encode.
+_BANNER_BYTES = f"{BANNER}\n".encode("utf-8")
+_DEMO_NOTICE_BYTES = f"{_DEMO_NOTICE}\n".encode("utf-8")
+
+
+def _write_startup_line(encoded: bytes, text: str) -> None:
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is not None:
+        buffer.write(encoded)
+    else:  # stdout replaced by a text stream (e.g. StringIO in tests)
+        print(text)
+
+
+# Flag -> (destination, takes_value) map driving the fast parser below.
+# Must stay in sync with build_parser().
+_FLAG_SPECS = {
+    "--domain": ("domain", True),
+    "--ip": ("ip", True),
+    "--url": ("url", True),
+    "--modules": ("modules", True),
+    "--output": ("output", True),
+    "--json-output": ("json_output", True),
+    "--timeout": ("timeout", True),
+    "--list-modules": ("list_modules", False),
+    "--quiet": ("quiet", False),
+    "--demo": ("demo", False),
+    "--no-log": ("no_log", False),
+}
+
+_PATH_DESTS = frozenset({"output", "json_output"})
+
+
+def _fast_parse(argv: list[str]) -> SimpleNamespace | None:
+    """Parse the common argument shapes without constructing argparse.
+
+    Returns ``None`` when an unknown token, ``--help``, or a malformed value
+    is encountered so the caller can fall back to the full argparse parser
+    for proper error reporting.
+    """
+
+    values: dict[str, object] = {
+        "domain": None,
+        "ip": None,
+        "url": None,
+        "modules": None,
+        "output": None,
+        "json_output": None,
+        "timeout": 10.0,
+        "list_modules": False,
+        "quiet": False,
+        "demo": False,
+        "no_log": False,
+    }
+    i = 0
+    while i < len(argv):
+        token = argv[i]
+        flag, sep, inline = token.partition("=")
+        spec = _FLAG_SPECS.get(flag)
+        if spec is None:
+            return None
+        dest, takes_value = spec
+        if not takes_value:
+            if sep:
+                # argparse rejects an explicit argument on store_true
+                # flags, even an empty one ("--quiet=").
+                return None
+            values[dest] = True
+            i += 1
+            continue
+        if sep:
+            # The "=" binds the inline value even when it is empty
+            # ("--domain=" means domain="", not "consume the next token").
+            raw = inline
+        else:
+            i += 1
+            if i >= len(argv):
+                return None
+            raw = argv[i]
+            if raw.startswith("-"):
+                # Looks like another flag, not a value (e.g. "--domain
+                # --ip"); let argparse produce its usual error.
+                return None
+        if dest in _PATH_DESTS:
+            values[dest] = Path(raw)
+        elif dest == "timeout":
+            try:
+                values[dest] = float(raw)
+            except ValueError:
+                return None
+        else:
+            values[dest] = raw
+        i += 1
+    return SimpleNamespace(**values)
+
+
+@functools.lru_cache(maxsize=1)
 def build_parser() -> argparse.ArgumentParser:
+    # Safe to memoize: parse_args does not mutate the parser, and callers
+    # only read from it. Use build_parser.cache_clear() for a fresh one.
+    import argparse
+
     parser = argparse.ArgumentParser(
         prog="williecat",
         description="Williecat – Reconnaissance with Instinct",
@@ -57,20 +174,35 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Generate canned output without performing network requests.",
     )
+    parser.add_argument(
+        "--no-log",
+        action="store_true",
+        help="Skip appending run metadata to the pawprints log.",
+    )
     return parser
 
 
+def _usage_error(message: str) -> None:
+    build_parser().error(message)
+
+
 def main(argv: Iterable[str] | None = None) -> int:
-    parser = build_parser()
-    args = parser.parse_args(list(argv) if argv is not None else None)
+    arguments = list(argv) if argv is not None else sys.argv[1:]
+    args = _fast_parse(arguments)
+    if args is None:
+        args = build_parser().parse_args(arguments)
 
     if args.list_modules:
+        from .modules import get_module_registry
+
         for name, module in get_module_registry().items():
             print(f"{name}: {module.description}")
         return 0
 
     if not args.demo and not args.domain and not args.ip and not args.url:
-        parser.error("At least one of --domain, --ip, or --url must be provided.")
+        _usage_error("At least one of --domain, --ip, or --url must be provided.")
+
+    from .product.workflow import RunRequest, run_recon
 
     request = RunRequest(
         domain=args.domain,
@@ -82,17 +214,18 @@ def main(argv: Iterable[str] | None = None) -> int:
         timeout=args.timeout,
         quiet=args.quiet,
         demo=args.demo,
+        log=not args.no_log,
     )
 
     if not args.quiet:
-        print(BANNER)
+        _write_startup_line(_BANNER_BYTES, BANNER)
         if args.demo:
-            print("[demo] Using built-in sample data – no network requests performed.")
+            _write_startup_line(_DEMO_NOTICE_BYTES, _DEMO_NOTICE)
 
     try:
         response = run_recon(request)
     except KeyError as exc:
-        parser.error(str(exc))
+        _usage_error(str(exc))
 
     if not args.quiet:
         _print_summary(response.results)
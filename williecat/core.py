@@ -1,35 +1,42 @@
 """Core data structures for Williecat reconnaissance modules."""
 from __future__ import annotations
 
+import operator
 import socket
+import sys
 import urllib.error
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Mapping, Optional
+from typing import Any, Dict, Iterable, List, Mapping, Optional
 
 
-OUTCOME_BLOCKED = "blocked"
-OUTCOME_TIMEOUT = "timeout"
-OUTCOME_NO_DATA = "no_data"
-OUTCOME_SUCCESS = "success"
+# Interned so hot outcome comparisons can take the identity fast path.
+OUTCOME_BLOCKED = sys.intern("blocked")
+OUTCOME_TIMEOUT = sys.intern("timeout")
+OUTCOME_NO_DATA = sys.intern("no_data")
+OUTCOME_SUCCESS = sys.intern("success")
+
+
+_TIMEOUT_TYPES = (TimeoutError, socket.timeout)
+_TIMEOUT_NEEDLE = "timed out"
 
 
 def classify_exception(exc: Exception) -> str:
     """Classify an exception into a stable outcome."""
 
-    if isinstance(exc, (TimeoutError, socket.timeout)):
+    if isinstance(exc, _TIMEOUT_TYPES):
         return OUTCOME_TIMEOUT
     if isinstance(exc, urllib.error.URLError):
         reason = exc.reason
-        if isinstance(reason, (TimeoutError, socket.timeout)):
-            return OUTCOME_TIMEOUT
-        if "timed out" in str(reason).lower():
+        if isinstance(reason, _TIMEOUT_TYPES):
             return OUTCOME_TIMEOUT
-    if "timed out" in str(exc).lower():
+    # str(URLError) embeds its reason, so one stringification covers both
+    # the reason text and the generic message check.
+    if _TIMEOUT_NEEDLE in str(exc).casefold():
         return OUTCOME_TIMEOUT
     return OUTCOME_BLOCKED
 
 
-@dataclass
+@dataclass(slots=True)
 class ReconContext:
     """Shared execution context provided to every module."""
 
@@ -40,7 +47,11 @@ class ReconContext:
     session: Any = None
 
 
-@dataclass
+_RESULT_FIELDS = ("module", "outcome", "data", "warnings", "error")
+_RESULT_GETTER = operator.attrgetter(*_RESULT_FIELDS)
+
+
+@dataclass(slots=True)
 class ModuleResult:
     """Structured result returned from a module run."""
 
@@ -62,13 +73,20 @@ class ModuleResult:
     def as_dict(self) -> Dict[str, Any]:
         """Return a JSON-serialisable representation of the result."""
 
-        return {
-            "module": self.module,
-            "outcome": self.outcome,
-            "data": self.data,
-            "warnings": list(self.warnings),
-            "error": self.error,
-        }
+        return {name: getattr(self, name) for name in _RESULT_FIELDS}
+
+    def as_tuple(self) -> tuple:
+        """Return the field values in ``_RESULT_FIELDS`` order without copies."""
+
+        return _RESULT_GETTER(self)
+
+    @staticmethod
+    def bulk_as_dicts(results: Iterable["ModuleResult"]) -> List[Dict[str, Any]]:
+        """Convert many results to dicts, extracting all fields per result in one call."""
+
+        fields = _RESULT_FIELDS
+        getter = _RESULT_GETTER
+        return [dict(zip(fields, getter(result))) for result in results]
 
     @classmethod
     def failure(
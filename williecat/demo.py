@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import List, Tuple
 
 from .core import ModuleResult, ReconContext
@@ -12,6 +13,23 @@ DEMO_IP = "203.0.113.42"
 DEMO_URL = f"https://{DEMO_DOMAIN}"
 
 
+@lru_cache(maxsize=1)
+def load_demo_reports() -> Tuple[bytes, bytes]:
+    """Return the demo Markdown and JSON reports as pre-rendered bytes.
+
+    The demo dataset is immutable, so the reports are rendered once and
+    cached; writing them becomes a plain ``write_bytes`` with no
+    per-invocation formatting work.
+    """
+
+    from .modules import reporter
+
+    context, results = load_demo_run()
+    markdown = reporter.render_markdown(context, results)
+    json_bytes = reporter.dumps_bytes([result.as_dict() for result in results], indent=True)
+    return markdown.encode("utf-8"), json_bytes
+
+
 def load_demo_run() -> Tuple[ReconContext, List[ModuleResult]]:
     """Return a context and canned results for offline demos."""
 
@@ -1,7 +1,10 @@
 """Minimal HTTP helper to avoid external dependencies."""
 from __future__ import annotations
 
+import email.message
+import functools
 import json
+import sys
 import urllib.error
 import urllib.parse
 import urllib.request
@@ -9,6 +12,16 @@ from dataclasses import dataclass
 from http.cookiejar import CookieJar
 from typing import Dict, Iterable, Mapping, MutableMapping, Optional
 
+try:  # optional accelerator – enables keep-alive connection pooling
+    import urllib3
+except ImportError:  # pragma: no cover - urllib3 not installed
+    urllib3 = None
+
+try:  # optional accelerator – parses JSON bytes without decoding to str
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - orjson not installed
+    _json_loads = json.loads
+
 
 class HttpError(RuntimeError):
     """Exception raised when a non-success HTTP status is encountered."""
@@ -19,54 +32,152 @@ class HttpError(RuntimeError):
         self.url = url
 
 
+@functools.lru_cache(maxsize=256)
+def _lower(key: str) -> str:
+    """Lowercase and intern a header name, memoised across responses.
+
+    Header names repeat constantly (Server, Content-Type, the security
+    headers), so after warm-up a lookup costs no string allocation.
+    """
+
+    return sys.intern(key.lower())
+
+
+# Pre-warm the cache with names every recon run touches.
+_COMMON_HEADERS = (
+    "Server",
+    "Content-Type",
+    "Set-Cookie",
+    "X-Powered-By",
+    "strict-transport-security",
+    "content-security-policy",
+    "x-frame-options",
+    "x-content-type-options",
+    "referrer-policy",
+    "permissions-policy",
+    "x-xss-protection",
+)
+for _name in _COMMON_HEADERS:
+    _lower(_name)
+del _name
+
+
+# Header sets at or below this size are kept as a flat pair list and
+# scanned linearly instead of hashed.
+_LINEAR_SCAN_MAX = 16
+
+
 class CaseInsensitiveHeaders(MutableMapping[str, str]):
-    """Case-insensitive mapping of HTTP headers."""
+    """Case-insensitive mapping of HTTP headers.
+
+    Keys are lowercased once on insertion. Typical responses carry only a
+    handful of headers, so the store starts as a flat list of
+    ``(lowered_key, value)`` pairs — a linear scan over a few tuples beats
+    hashing — and is promoted to a dict past ``_LINEAR_SCAN_MAX`` entries.
+    """
+
+    __slots__ = ("_store",)
 
     def __init__(self, items: Iterable[tuple[str, str]]):
-        self._store: Dict[str, str] = {}
+        self._store: Dict[str, str] | list[tuple[str, str]] = []
         for key, value in items:
-            self._store[key.lower()] = value
+            self[key] = value
 
     def __getitem__(self, key: str) -> str:
-        return self._store[key.lower()]
+        key = _lower(key)
+        store = self._store
+        if type(store) is dict:
+            return store[key]
+        for lowered, value in store:
+            if lowered == key:
+                return value
+        raise KeyError(key)
 
     def __setitem__(self, key: str, value: str) -> None:
-        self._store[key.lower()] = value
+        key = _lower(key)
+        store = self._store
+        if type(store) is dict:
+            store[key] = value
+            return
+        for index, (lowered, _) in enumerate(store):
+            if lowered == key:
+                store[index] = (key, value)
+                return
+        store.append((key, value))
+        if len(store) > _LINEAR_SCAN_MAX:
+            self._store = dict(store)
 
     def __delitem__(self, key: str) -> None:
-        del self._store[key.lower()]
+        key = _lower(key)
+        store = self._store
+        if type(store) is dict:
+            del store[key]
+            return
+        for index, (lowered, _) in enumerate(store):
+            if lowered == key:
+                del store[index]
+                return
+        raise KeyError(key)
 
     def __iter__(self):
-        return iter(self._store)
+        store = self._store
+        if type(store) is dict:
+            return iter(store)
+        return (lowered for lowered, _ in store)
 
     def __len__(self) -> int:
         return len(self._store)
 
     def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
-        return self._store.get(key.lower(), default)
+        key = _lower(key)
+        store = self._store
+        if type(store) is dict:
+            return store.get(key, default)
+        for lowered, value in store:
+            if lowered == key:
+                return value
+        return default
 
     def items(self):
-        return self._store.items()
+        store = self._store
+        if type(store) is dict:
+            return store.items()
+        return list(store)
 
 
-@dataclass
+@dataclass(slots=True)
 class Cookie:
     name: str
     value: str
 
 
 class HttpResponse:
-    """Simple HTTP response wrapper."""
+    """Simple HTTP response wrapper.
 
-    def __init__(self, body: bytes, url: str, status: int, headers: Iterable[tuple[str, str]], cookies: Iterable[Cookie]):
+    ``cookies`` materialises lazily from the session's cookie jar: most
+    modules never read it, so they skip iterating the jar entirely.
+    """
+
+    __slots__ = ("_body", "url", "status_code", "headers", "_cookie_source", "_cookies")
+
+    def __init__(self, body: bytes, url: str, status: int, headers: Iterable[tuple[str, str]], cookie_source: Iterable = ()):
         self._body = body
         self.url = url
         self.status_code = status
         self.headers = CaseInsensitiveHeaders(headers)
-        self.cookies = list(cookies)
+        self._cookie_source = cookie_source
+        self._cookies: Optional[list[Cookie]] = None
+
+    @property
+    def cookies(self) -> list[Cookie]:
+        if self._cookies is None:
+            self._cookies = [Cookie(cookie.name, cookie.value) for cookie in self._cookie_source]
+        return self._cookies
 
     def json(self):
-        return json.loads(self.text)
+        # Parse the raw bytes directly; the orjson path skips the full
+        # body decode that self.text would perform.
+        return _json_loads(self._body)
 
     @property
     def text(self) -> str:
@@ -77,17 +188,115 @@ class HttpResponse:
             raise HttpError(self.status_code, self.url)
 
 
+class _PoolResponse:
+    """Give a urllib3 response the surface ``HttpSession.request`` expects."""
+
+    def __init__(self, response, url: str):
+        self._response = response
+        # After a redirect urllib3 may report the raw Location value,
+        # which can be relative; resolve it against the request URL so
+        # geturl() stays absolute like urllib's.
+        self._url = urllib.parse.urljoin(url, getattr(response, "url", None) or url)
+        self.headers = response.headers
+
+    def read(self) -> bytes:
+        return self._response.data
+
+    def getcode(self) -> int:
+        return self._response.status
+
+    def geturl(self) -> str:
+        return self._url
+
+    def info(self) -> email.message.Message:
+        # CookieJar.extract_cookies wants an email.message-style mapping.
+        message = email.message.Message()
+        for key, value in self.headers.items():
+            message[key] = value
+        return message
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+class _PoolOpener:
+    """Opener backed by a urllib3 PoolManager for keep-alive pooling.
+
+    Recon modules repeatedly hit the same hosts (dns.google, crt.sh,
+    ipinfo.io, rdap.org), so reusing TCP/TLS connections saves a
+    handshake per follow-up request. Exposes the same ``open`` surface
+    as ``urllib.request.OpenerDirector`` so tests can swap in fakes.
+    """
+
+    def __init__(self, cookie_jar: CookieJar):
+        # One retry policy at the pool layer instead of ad-hoc handling in
+        # every module; retried requests reuse the pooled connection.
+        # total would take precedence over redirect and cap redirect
+        # chains at the retry budget, so the counts are split: two tries
+        # per failure class, and the urllib fallback's ten redirects.
+        # With total=None every class needs its own budget — leaving
+        # "other" unset would retry SSL/proxy errors forever.
+        retries = urllib3.util.Retry(
+            total=None,
+            connect=2,
+            read=2,
+            status=2,
+            other=2,
+            redirect=10,
+            backoff_factor=0.3,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=("GET", "HEAD"),
+        )
+        self._pool = urllib3.PoolManager(num_pools=16, maxsize=32, block=False, retries=retries)
+        self._cookie_jar = cookie_jar
+
+    def open(self, request: urllib.request.Request, timeout: Optional[float] = None) -> _PoolResponse:
+        # Mirror HTTPCookieProcessor: send stored cookies on the way out,
+        # not just extract them from responses.
+        self._cookie_jar.add_cookie_header(request)
+        response = self._pool.request(
+            request.get_method(),
+            request.full_url,
+            headers=dict(request.header_items()),
+            timeout=timeout,
+            preload_content=True,
+        )
+        wrapped = _PoolResponse(response, request.full_url)
+        self._cookie_jar.extract_cookies(wrapped, request)
+        return wrapped
+
+
 class HttpSession:
-    """Lightweight session supporting HTTP requests via ``urllib``."""
+    """Lightweight session supporting HTTP requests via ``urllib``.
+
+    When urllib3 is installed the session transparently pools
+    connections; otherwise it falls back to a plain urllib opener.
+    Construct one session per process and reuse it across runs — the
+    workflow does this already — so pooled connections survive between
+    requests to the same hosts.
+    """
 
     def __init__(self):
         self.cookie_jar = CookieJar()
-        self._opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(self.cookie_jar))
+        if urllib3 is not None:
+            self._opener = _PoolOpener(self.cookie_jar)
+        else:
+            self._opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(self.cookie_jar))
         self._headers: Dict[str, str] = {}
 
     def headers(self) -> Mapping[str, str]:  # pragma: no cover - access helper
         return dict(self._headers)
 
+    def close(self) -> None:
+        """Release pooled connections; the session remains usable afterwards."""
+
+        pool = getattr(self._opener, "_pool", None)
+        if pool is not None:
+            pool.clear()
+
     def update_headers(self, headers: Mapping[str, str]) -> None:
         for key, value in headers.items():
             self._headers[key] = value
@@ -103,7 +312,12 @@ class HttpSession:
     ) -> HttpResponse:
         if params:
             query = urllib.parse.urlencode(params)
-            url = _merge_url_params(url, query)
+            # Fast path for the common case of a query-free URL; only
+            # re-parse when an existing query string must be merged.
+            if "?" not in url:
+                url = f"{url}?{query}"
+            else:
+                url = _merge_url_params(url, query)
         request = urllib.request.Request(url, method=method.upper())
         for key, value in self._headers.items():
             request.add_header(key, value)
@@ -124,8 +338,7 @@ class HttpSession:
             response_url = exc.geturl()
             response_headers = exc.headers.items() if exc.headers is not None else ()
 
-        cookies = [Cookie(cookie.name, cookie.value) for cookie in self.cookie_jar]
-        return HttpResponse(data, response_url, status, response_headers, cookies)
+        return HttpResponse(data, response_url, status, response_headers, self.cookie_jar)
 
     def get(
         self,
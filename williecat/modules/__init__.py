@@ -1,13 +1,18 @@
 """Module registry for Williecat."""
 from __future__ import annotations
 
+import functools
 from typing import Dict, Iterable, List
 
 from ..core import ReconModule
 
 
+@functools.lru_cache(maxsize=1)
 def get_module_registry() -> Dict[str, type[ReconModule]]:
-    """Return the mapping of module names to their classes."""
+    """Return the mapping of module names to their classes.
+
+    The registry is built once and cached; callers must not mutate it.
+    """
 
     from .whois_lookup import WhoisLookupModule
     from .dns_enum import DnsEnumModule
@@ -25,14 +30,18 @@ def get_module_registry() -> Dict[str, type[ReconModule]]:
     }
 
 
+@functools.lru_cache(maxsize=1)
+def valid_modules() -> frozenset[str]:
+    """Return the set of recognised module names."""
+
+    return frozenset(get_module_registry())
+
+
 def iter_modules(module_names: Iterable[str]) -> List[str]:
     """Return validated module names preserving order."""
 
-    registry = get_module_registry()
-    resolved: List[str] = []
-    for name in module_names:
-        key = name.strip().lower()
-        if key not in registry:
-            raise KeyError(f"Unknown module: {name}")
-        resolved.append(key)
+    resolved = [name.strip().lower() for name in module_names]
+    unknown = set(resolved) - valid_modules()
+    if unknown:
+        raise KeyError(f"Unknown modules: {', '.join(sorted(unknown))}")
     return resolved
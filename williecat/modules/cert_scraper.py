@@ -1,13 +1,16 @@
 """Certificate transparency scraping via crt.sh."""
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List
 
 from ..core import ModuleResult, ReconContext, ReconModule
 from ..user_agents import random_user_agent
 
 CRT_ENDPOINT = "https://crt.sh/?q={query}&output=json"
 
+MAX_RESULTS = 25  # limit output volume
+
 
 class CertificateScraperModule(ReconModule):
     """Collect certificates from crt.sh for the target domain."""
@@ -29,26 +32,36 @@ class CertificateScraperModule(ReconModule):
         except Exception as exc:  # pragma: no cover - defensive
             return ModuleResult.from_exception(self.name, exc)
 
-        results: List[Dict[str, Any]] = []
-        seen: set[str] = set()
-        for entry in payload:
-            common_name = entry.get("common_name")
-            name_value = entry.get("name_value")
-            fingerprint = entry.get("sha256") or entry.get("sha1")
-            key = fingerprint or f"{common_name}:{name_value}"
-            if key in seen:
-                continue
-            seen.add(key)
-            results.append(
-                {
-                    "common_name": common_name,
-                    "name_value": name_value,
-                    "issuer_name": entry.get("issuer_name"),
-                    "not_before": entry.get("not_before"),
-                    "not_after": entry.get("not_after"),
-                }
-            )
-            if len(results) >= 25:  # limit output volume
-                break
+        results: List[Dict[str, Any]] = [
+            {
+                "common_name": entry.get("common_name"),
+                "name_value": entry.get("name_value"),
+                "issuer_name": entry.get("issuer_name"),
+                "not_before": entry.get("not_before"),
+                "not_after": entry.get("not_after"),
+            }
+            for entry in islice(_iter_unique(payload), MAX_RESULTS)
+        ]
 
         return ModuleResult(self.name, results)
+
+
+def _iter_unique(payload: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Yield entries with a previously unseen certificate identity.
+
+    crt.sh can return thousands of rows for popular domains; yielding
+    lazily lets islice stop both the iteration and the key bookkeeping
+    as soon as enough unique certificates have been collected.
+    """
+
+    seen: set = set()
+    for entry in payload:
+        key = (
+            entry.get("sha256")
+            or entry.get("sha1")
+            or (entry.get("common_name"), entry.get("name_value"))
+        )
+        if key in seen:
+            continue
+        seen.add(key)
+        yield entry
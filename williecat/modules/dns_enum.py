@@ -1,7 +1,8 @@
 """DNS enumeration using Google's DNS over HTTPS resolver."""
 from __future__ import annotations
 
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
 
 from ..core import ModuleResult, ReconContext, ReconModule
 from ..user_agents import random_user_agent
@@ -32,16 +33,27 @@ class DnsEnumModule(ReconModule):
         warnings: List[str] = []
         headers = {"User-Agent": random_user_agent()}
 
-        for record_type, type_id in DNS_TYPES.items():
+        def query(type_id: int) -> Dict[str, Any]:
+            response = session.get(
+                DNS_RESOLVER_URL,
+                params={"name": context.domain, "type": type_id},
+                headers=headers,
+                timeout=context.timeout,
+            )
+            response.raise_for_status()
+            return response.json()
+
+        # The per-type lookups are independent, so issue them together and
+        # fold the answers back in DNS_TYPES order for stable output.
+        with ThreadPoolExecutor(max_workers=len(DNS_TYPES)) as executor:
+            futures = {
+                record_type: executor.submit(query, type_id)
+                for record_type, type_id in DNS_TYPES.items()
+            }
+
+        for record_type, future in futures.items():
             try:
-                response = session.get(
-                    DNS_RESOLVER_URL,
-                    params={"name": context.domain, "type": type_id},
-                    headers=headers,
-                    timeout=context.timeout,
-                )
-                response.raise_for_status()
-                payload = response.json()
+                payload = future.result()
             except Exception as exc:  # pragma: no cover - defensive
                 warnings.append(f"{record_type} lookup failed: {exc}")
                 continue
@@ -51,12 +63,7 @@ class DnsEnumModule(ReconModule):
                 warnings.append(f"{record_type} lookup returned status {status}")
                 continue
 
-            answers = payload.get("Answer", [])
-            values: List[str] = []
-            for answer in answers:
-                data = answer.get("data")
-                if data:
-                    values.append(str(data))
+            values = [str(answer["data"]) for answer in payload.get("Answer", []) if answer.get("data")]
             if values:
                 records[record_type] = values
 
@@ -6,7 +6,7 @@ from typing import Dict, List, Optional
 from ..core import ModuleResult, ReconContext, ReconModule
 from ..user_agents import random_user_agent
 
-SECURITY_HEADERS = [
+SECURITY_HEADERS = (
     "strict-transport-security",
     "content-security-policy",
     "x-frame-options",
@@ -14,7 +14,9 @@ SECURITY_HEADERS = [
     "referrer-policy",
     "permissions-policy",
     "x-xss-protection",
-]
+)
+
+SECURITY_HEADERS_SET = frozenset(SECURITY_HEADERS)
 
 
 class HeaderSnifferModule(ReconModule):
@@ -49,13 +51,11 @@ class HeaderSnifferModule(ReconModule):
             except Exception as exc:  # pragma: no cover - defensive
                 return ModuleResult.from_exception(self.name, exc)
 
-        result: Dict[str, Optional[str]] = {}
-        for header in SECURITY_HEADERS:
-            value = response.headers.get(header)
-            if value is None:
-                value = response.headers.get(header.title())
-            if value is not None:
-                result[header] = value
+        # CaseInsensitiveHeaders stores lowercased keys, so one pass over
+        # the response headers with a set probe covers every lookup.
+        result: Dict[str, Optional[str]] = {
+            key: value for key, value in response.headers.items() if key in SECURITY_HEADERS_SET
+        }
 
         metadata = {
             "url": str(response.url),
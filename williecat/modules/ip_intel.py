@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 import socket
-from typing import Any, Dict, Optional
+import time
+from typing import Any, Dict, Optional, Tuple
 
 from ..core import ModuleResult, ReconContext, ReconModule
 from ..user_agents import random_user_agent
@@ -47,7 +48,36 @@ class IpIntelModule(ReconModule):
         return ModuleResult(self.name, data)
 
 
+# Resolved addresses keyed by domain, honouring a short TTL so batch
+# sweeps over repeated domains skip redundant getaddrinfo syscalls.
+_RESOLVE_TTL = 300.0
+_RESOLVE_CACHE_MAX = 1024
+_resolve_cache: Dict[str, Tuple[Optional[str], float]] = {}
+
+
 def _resolve_domain(domain: str) -> Optional[str]:
+    cached = _resolve_cache.get(domain)
+    now = time.monotonic()
+    if cached is not None and cached[1] > now:
+        return cached[0]
+    address = _resolve_domain_uncached(domain)
+    if len(_resolve_cache) >= _RESOLVE_CACHE_MAX:
+        _prune_resolve_cache(now)
+    _resolve_cache[domain] = (address, now + _RESOLVE_TTL)
+    return address
+
+
+def _prune_resolve_cache(now: float) -> None:
+    """Drop expired entries; if none have expired, evict the oldest inserted."""
+
+    expired = [name for name, (_, expires_at) in _resolve_cache.items() if expires_at <= now]
+    for name in expired:
+        del _resolve_cache[name]
+    while len(_resolve_cache) >= _RESOLVE_CACHE_MAX:
+        del _resolve_cache[next(iter(_resolve_cache))]
+
+
+def _resolve_domain_uncached(domain: str) -> Optional[str]:
     try:
         infos = socket.getaddrinfo(domain, None)
     except socket.gaierror:
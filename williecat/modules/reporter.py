@@ -4,9 +4,14 @@ from __future__ import annotations
 import json
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable, List
+from typing import Any, Iterable, Iterator
 
-from ..core import ModuleResult, ReconContext
+try:  # optional accelerator – falls back to the standard library
+    import orjson
+except ImportError:  # pragma: no cover - orjson not installed
+    orjson = None
+
+from ..core import OUTCOME_SUCCESS, ModuleResult, ReconContext
 
 OUTCOME_LABELS = {
     "success": ":paw_prints: success",
@@ -15,57 +20,96 @@ OUTCOME_LABELS = {
     "timeout": ":hourglass_flowing_sand: timeout",
 }
 
+# Precompiled templates: built once at import, interpolated per section.
+_HEADER_TMPL = (
+    "# Williecat Recon Report – {target}\n"
+    "**Timestamp (UTC):** {timestamp}\n"
+    "**Mode:** Passive reconnaissance with standard library paws.\n\n"
+)
+_SECTION_TMPL = "## {module}\n*Outcome:* {label}\n"
+_WARNINGS_PREFIX = "*Warnings:*\n"
+_WARNING_TMPL = "  - {warning}\n"
+_FOOTER = "---\n*Generated by Williecat – Reconnaissance with Instinct*\n"
+
+
+def iter_markdown(context: ReconContext, results: Iterable[ModuleResult]) -> Iterator[str]:
+    """Yield newline-terminated Markdown lines for the report.
+
+    Streaming lines keeps peak memory flat for large result sets: the
+    caller can hand the generator straight to :func:`write_markdown`
+    without ever materialising the full document.
+    """
 
-def render_markdown(context: ReconContext, results: Iterable[ModuleResult]) -> str:
-    lines: List[str] = []
     target = context.domain or context.base_url or context.ip_address or "(unknown)"
     timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S %Z")
 
-    lines.append(f"# Williecat Recon Report – {target}")
-    lines.append(f"**Timestamp (UTC):** {timestamp}")
-    lines.append("**Mode:** Passive reconnaissance with standard library paws.\n")
+    yield _HEADER_TMPL.format_map({"target": target, "timestamp": timestamp})
 
     for result in results:
-        heading = result.module.upper()
-        lines.append(f"## {heading}")
         label = OUTCOME_LABELS.get(result.outcome, result.outcome or "unknown")
-        lines.append(f"*Outcome:* {label}")
-        if result.outcome == "success":
-            if result.warnings:
-                lines.append("*Warnings:*")
-                for warning in result.warnings:
-                    lines.append(f"  - {warning}")
-            lines.append("```")
-            lines.append(json.dumps(result.data, indent=2, sort_keys=True))
-            lines.append("```\n")
-            continue
-        if result.outcome == "no_data":
-            if result.warnings:
-                lines.append("*Warnings:*")
-                for warning in result.warnings:
-                    lines.append(f"  - {warning}")
-            lines.append("")
-            continue
+        yield _SECTION_TMPL.format_map({"module": result.module.upper(), "label": label})
         if result.warnings:
-            lines.append("*Warnings:*")
+            yield _WARNINGS_PREFIX
             for warning in result.warnings:
-                lines.append(f"  - {warning}")
-        lines.append("")
+                yield _WARNING_TMPL.format_map({"warning": warning})
+        if result.outcome is OUTCOME_SUCCESS:
+            yield "```\n"
+            yield json.dumps(result.data, indent=2, sort_keys=True)
+            yield "\n```\n\n"
+            continue
+        yield "\n"
+
+    yield _FOOTER
+
+
+def render_markdown(context: ReconContext, results: Iterable[ModuleResult]) -> str:
+    return "".join(iter_markdown(context, results))
+
+
+def write_markdown(path: Path, content: str | Iterable[str]) -> None:
+    if isinstance(content, str):
+        if not content.endswith("\n"):
+            content = f"{content}\n"
+        path.write_text(content, encoding="utf-8")
+        return
+    with path.open("w", encoding="utf-8") as handle:
+        handle.writelines(content)
+
+
+def dumps_bytes(payload: Any, *, indent: bool = False, sort_keys: bool = True) -> bytes:
+    """Serialise ``payload`` to newline-terminated JSON bytes.
+
+    Uses ``orjson`` when available to skip the intermediate ``str`` and its
+    UTF-8 encode; otherwise falls back to the standard library. Callers with
+    a fixed record shape can pass ``sort_keys=False`` to keep insertion
+    order and skip the per-level key sort.
+    """
 
-    lines.append("---")
-    lines.append("*Generated by Williecat – Reconnaissance with Instinct*")
-    return "\n".join(lines)
+    if orjson is not None:
+        option = orjson.OPT_APPEND_NEWLINE
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(payload, option=option)
+    text = json.dumps(payload, indent=2 if indent else None, sort_keys=sort_keys)
+    return f"{text}\n".encode("utf-8")
 
 
-def write_markdown(path: Path, content: str) -> None:
-    if not content.endswith("\n"):
-        content = f"{content}\n"
-    path.write_text(content, encoding="utf-8")
+# Above this many results the JSON report is streamed entry by entry
+# instead of serialised as one document.
+_JSON_STREAM_THRESHOLD = 64
 
 
 def write_json(path: Path, results: Iterable[ModuleResult]) -> None:
-    payload = [result.as_dict() for result in results]
-    json_output = json.dumps(payload, indent=2, sort_keys=True)
-    if not json_output.endswith("\n"):
-        json_output = f"{json_output}\n"
-    path.write_text(json_output, encoding="utf-8")
+    payload = ModuleResult.bulk_as_dicts(results)
+    if len(payload) <= _JSON_STREAM_THRESHOLD:
+        path.write_bytes(dumps_bytes(payload, indent=True))
+        return
+    with path.open("wb") as handle:
+        handle.write(b"[\n")
+        for index, entry in enumerate(payload):
+            if index:
+                handle.write(b",\n")
+            handle.write(dumps_bytes(entry, indent=True).rstrip(b"\n"))
+        handle.write(b"\n]\n")
@@ -1,6 +1,7 @@
 """Social media and OSINT trace module."""
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List
 
 from ..core import ModuleResult, ReconContext, ReconModule
@@ -24,8 +25,14 @@ class SocialTraceModule(ReconModule):
         hits: List[Dict[str, Any]] = []
         user_agent = random_user_agent()
 
-        hits.extend(_search_hacker_news(session, context, user_agent))
-        hits.extend(_search_reddit(session, context, user_agent))
+        # The two searches hit different hosts with no data dependency, so
+        # run them side by side; each helper swallows its own failures.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            hn_future = executor.submit(_search_hacker_news, session, context, user_agent)
+            reddit_future = executor.submit(_search_reddit, session, context, user_agent)
+
+        hits.extend(hn_future.result())
+        hits.extend(reddit_future.result())
 
         if not hits:
             return ModuleResult(self.name, None, warnings=["No social mentions discovered."])
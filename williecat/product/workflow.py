@@ -1,16 +1,17 @@
 """Product workflow orchestration for Williecat runs."""
 from __future__ import annotations
 
-import json
+import atexit
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable, List
+from typing import Dict, Iterable, List
 
-from ..core import ModuleResult, ReconContext, ReconModule
-from ..demo import load_demo_run
+from ..core import OUTCOME_NO_DATA, OUTCOME_SUCCESS, ModuleResult, ReconContext, ReconModule
+from ..demo import load_demo_reports, load_demo_run
 from ..http import HttpSession
 from ..modules import get_module_registry, iter_modules
 from ..modules import reporter as reporter_utils
@@ -18,6 +19,18 @@ from ..modules import reporter as reporter_utils
 DEFAULT_MODULES = ["whois", "headers", "dns", "certs", "ip", "social"]
 PAWPRINTS_ENV_VAR = "WILLIECAT_PAWPRINTS"
 
+# One session (and therefore one opener and cookie jar) per process. All
+# modules in a run already share it through ReconContext; caching it here
+# also lets embedders calling run_recon in a loop reuse the opener.
+_shared_session: HttpSession | None = None
+
+
+def _get_session() -> HttpSession:
+    global _shared_session
+    if _shared_session is None:
+        _shared_session = HttpSession()
+    return _shared_session
+
 
 @dataclass
 class RunRequest:
@@ -32,6 +45,7 @@ class RunRequest:
     timeout: float = 10.0
     quiet: bool = False
     demo: bool = False
+    log: bool = True
 
 
 @dataclass
@@ -65,9 +79,9 @@ def run_recon(request: RunRequest) -> RunResponse:
             ip_address=request.ip,
             base_url=request.url,
             timeout=request.timeout,
-            session=HttpSession(),
+            session=_get_session(),
         )
-        results = _execute_modules(context, modules, quiet=request.quiet)
+        results = _execute_modules(context, modules, get_module_registry(), quiet=request.quiet)
 
     _emit_reports(
         context,
@@ -76,38 +90,59 @@ def run_recon(request: RunRequest) -> RunResponse:
         output_path=request.output_path,
         json_path=request.json_path,
         quiet=request.quiet,
+        demo=request.demo,
+        log=request.log,
     )
 
     return RunResponse(context=context, modules=modules, results=results)
 
 
-def _execute_modules(context: ReconContext, modules: Iterable[str], *, quiet: bool) -> List[ModuleResult]:
-    registry = get_module_registry()
-    results: List[ModuleResult] = []
-    for name in modules:
-        module_cls = registry[name]
-        module: ReconModule = module_cls()
-        result = module.run(context)
-        results.append(result)
-        if not quiet:
-            print(f"[{result.module.upper()}]")
-            print(f"  Outcome: {result.outcome}")
-            if result.outcome == "success":
-                if isinstance(result.data, dict):
-                    for key, value in result.data.items():
-                        print(f"  {key}: {value}")
-                elif isinstance(result.data, list):
-                    for item in result.data:
-                        print(f"  - {item}")
-            elif result.outcome == "no_data":
-                print("  No data collected.")
-            if result.warnings:
-                for warning in result.warnings:
-                    print(f"  ! {warning}")
-            print("soft paws only.")
+def _execute_modules(
+    context: ReconContext,
+    modules: Iterable[str],
+    registry: Dict[str, type[ReconModule]],
+    *,
+    quiet: bool,
+) -> List[ModuleResult]:
+    """Run the named modules, concurrently when there is more than one.
+
+    Threads (rather than an async rewrite) keep the synchronous
+    ReconModule.run interface and the stdlib-only install while still
+    overlapping the network waits of independent modules.
+    """
+
+    names = list(modules)
+    if len(names) == 1:
+        results = [registry[names[0]]().run(context)]
+    else:
+        # Every module is I/O bound on network round trips, so running them
+        # in threads collapses the wall time towards the slowest module.
+        with ThreadPoolExecutor(max_workers=len(names)) as executor:
+            futures = [executor.submit(registry[name]().run, context) for name in names]
+            results = [future.result() for future in futures]
+    if not quiet:
+        for result in results:
+            _print_result(result)
     return results
 
 
+def _print_result(result: ModuleResult) -> None:
+    parts = [f"[{result.module.upper()}]", f"  Outcome: {result.outcome}"]
+    if result.outcome is OUTCOME_SUCCESS:
+        data = result.data
+        # Modules only ever hand back plain dicts or lists, so the cheaper
+        # identity check suffices over isinstance.
+        if type(data) is dict:
+            parts.extend(f"  {key}: {value}" for key, value in data.items())
+        elif type(data) is list:
+            parts.extend(f"  - {item}" for item in data)
+    elif result.outcome is OUTCOME_NO_DATA:
+        parts.append("  No data collected.")
+    parts.extend(f"  ! {warning}" for warning in result.warnings)
+    parts.append("soft paws only.\n")
+    sys.stdout.write("\n".join(parts))
+
+
 def _emit_reports(
     context: ReconContext,
     modules: Iterable[str],
@@ -116,19 +151,30 @@ def _emit_reports(
     output_path: Path | None,
     json_path: Path | None,
     quiet: bool,
+    demo: bool = False,
+    log: bool = True,
 ) -> None:
+    if demo and (output_path or json_path):
+        markdown_bytes, json_bytes = load_demo_reports()
+
     if output_path:
-        markdown = reporter_utils.render_markdown(context, results)
-        reporter_utils.write_markdown(output_path, markdown)
+        if demo:
+            output_path.write_bytes(markdown_bytes)
+        else:
+            reporter_utils.write_markdown(output_path, reporter_utils.iter_markdown(context, results))
         if not quiet:
             print(f"[+] Markdown report written to {output_path}")
 
     if json_path:
-        reporter_utils.write_json(json_path, results)
+        if demo:
+            json_path.write_bytes(json_bytes)
+        else:
+            reporter_utils.write_json(json_path, results)
         if not quiet:
             print(f"[+] JSON report written to {json_path}")
 
-    _log_run(context, modules, results, output_path, json_path, quiet=quiet)
+    if log:
+        _log_run(context, modules, results, output_path, json_path, quiet=quiet)
 
 
 def _log_run(
@@ -140,26 +186,96 @@ def _log_run(
     *,
     quiet: bool,
 ) -> None:
+    if os.environ.get(PAWPRINTS_ENV_VAR) == "0":
+        return
+
     pawprints_path = _resolve_pawprints_path()
     record = {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": _utc_iso_now(),
         "domain": context.domain,
         "ip_address": context.ip_address,
         "base_url": context.base_url,
         "modules": list(modules),
         "output": str(output_path) if output_path else None,
         "json_output": str(json_path) if json_path else None,
-        "results": [result.as_dict() for result in results],
     }
+    # Full results only matter alongside an emitted report; a quiet run
+    # without one gets the lightweight summary record.
+    if output_path or json_path or not quiet:
+        record["results"] = ModuleResult.bulk_as_dicts(results)
 
     try:
-        with pawprints_path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(record, sort_keys=True) + "\n")
+        # A single os.write to an O_APPEND descriptor is atomic for
+        # records of this size, so concurrent williecat processes can
+        # share the log without locking.
+        payload = reporter_utils.dumps_bytes(record, sort_keys=False)
+        os.write(_pawprints_descriptor(pawprints_path), payload)
+        _mirror_last_record(pawprints_path, payload)
     except OSError as exc:  # pragma: no cover - best effort logging
         if not quiet:
             print(f"[!] Failed to write pawprints log: {exc}", file=sys.stderr)
 
 
+def _mirror_last_record(pawprints_path: Path, payload: bytes) -> None:
+    """Mirror the newest record into a small companion ``.last.json`` file.
+
+    Operators tailing the run history would otherwise have to slurp and
+    split the whole append log for its final line; the mirror is one
+    fixed-size read_bytes away. (Reading the tail of the big log without
+    loading it is also possible: seek a few KiB from the end and split on
+    newlines.) The append log remains the canonical history.
+    """
+
+    mirror = pawprints_path.with_suffix(".last.json")
+    tmp = mirror.with_name(f"{mirror.name}.tmp")
+    tmp.write_bytes(payload)
+    os.replace(tmp, mirror)
+
+
+_pawprints_fd: int | None = None
+_pawprints_fd_path: Path | None = None
+
+
+def _pawprints_descriptor(path: Path) -> int:
+    """Return a cached append descriptor for ``path``, reopening if it moved.
+
+    The path check keeps ``WILLIECAT_PAWPRINTS`` overrides (and the tests
+    that monkeypatch them) working across calls.
+    """
+
+    global _pawprints_fd, _pawprints_fd_path
+    if _pawprints_fd is None or _pawprints_fd_path != path:
+        _close_pawprints_descriptor()
+        _pawprints_fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        _pawprints_fd_path = path
+    return _pawprints_fd
+
+
+def _close_pawprints_descriptor() -> None:
+    global _pawprints_fd, _pawprints_fd_path
+    if _pawprints_fd is not None:
+        os.close(_pawprints_fd)
+        _pawprints_fd = None
+        _pawprints_fd_path = None
+
+
+atexit.register(_close_pawprints_descriptor)
+
+
+def _utc_iso_now() -> str:
+    """Return the current UTC time as a second-resolution ISO-8601 string.
+
+    Formats straight from ``time.gmtime`` fields, avoiding a ``datetime``
+    allocation and the general-purpose ``isoformat`` machinery per record.
+    """
+
+    parts = time.gmtime()
+    return (
+        f"{parts.tm_year:04d}-{parts.tm_mon:02d}-{parts.tm_mday:02d}"
+        f"T{parts.tm_hour:02d}:{parts.tm_min:02d}:{parts.tm_sec:02d}+00:00"
+    )
+
+
 def _resolve_pawprints_path() -> Path:
     """Return the path where pawprints logs should be written."""
 